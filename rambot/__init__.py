@@ -12,8 +12,7 @@ from .scraper import (
     Wait
 )
 from .http import (
-    request,
-    soupify
+    request
 )
 from .types import (
     IScraper,
@@ -29,6 +28,15 @@ from .logging_config import (
 )
 from . import helpers
 
+
+def __getattr__(name):
+    # `soupify` pulls in bs4, so it is only imported when first accessed.
+    if name == "soupify":
+        from .http import soupify
+        return soupify
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "0.1.6"
 __all__ = [
     "Scraper", 
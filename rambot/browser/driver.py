@@ -1,11 +1,30 @@
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from botasaurus_driver.driver import Driver as BTDriver, cdp
-from botasaurus_driver.core import util, element
+from botasaurus_driver.core import element
 from .element import Element, make_element
 
 
+# Collects the nodes matching an XPath evaluated from `this` into an array.
+_SCOPED_XPATH_JS = """
+function(xpath) {
+    const out = [];
+    const iter = document.evaluate(
+        xpath,
+        this,
+        null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+        null
+    );
+    for (let i = 0; i < iter.snapshotLength; i++) {
+        out.push(iter.snapshotItem(i));
+    }
+    return out;
+}
+"""
+
+
 class Driver(BTDriver):
     """
     Enhanced Botasaurus Driver with XPath search support,
@@ -20,6 +39,7 @@ class Driver(BTDriver):
             **kwargs: Any arguments to pass to the base BTDriver.
         """
         super().__init__(**kwargs)
+        self._agents_tab = None
 
     def find_by_xpath(
         self,
@@ -74,9 +94,16 @@ class Driver(BTDriver):
     def _enable_agents(self) -> None:
         """
         Enable the DOM and Runtime agents in the browser tab.
+
+        Agents stay enabled for the lifetime of a tab, so the two CDP round-trips
+        are only paid the first time a tab is searched.
         """
-        self._tab.send(cdp.dom.enable())
-        self._tab.send(cdp.runtime.enable())
+        tab = self._tab
+        if tab is self._agents_tab:
+            return
+        tab.send(cdp.dom.enable())
+        tab.send(cdp.runtime.enable())
+        self._agents_tab = tab
 
     def _get_full_document(self) -> "cdp.dom.Node":
         """
@@ -87,6 +114,30 @@ class Driver(BTDriver):
         """
         return self._tab.send(cdp.dom.get_document(depth=-1, pierce=True))
 
+    def _index_nodes(self, doc: "cdp.dom.Node") -> Dict[int, "cdp.dom.Node"]:
+        """
+        Map node ids to nodes for the whole document, including shadow DOMs.
+
+        Built once per search so every match is resolved with a dict lookup
+        instead of a full tree walk.
+
+        Args:
+            doc: Full document root Node.
+
+        Returns:
+            Dictionary of node id to Node.
+        """
+        index: Dict[int, "cdp.dom.Node"] = {}
+        stack: List["cdp.dom.Node"] = list(doc.children or [])
+        while stack:
+            node = stack.pop()
+            index.setdefault(node.node_id, node)
+            if node.children:
+                stack.extend(node.children)
+            if node.shadow_roots and node.shadow_roots[0].children:
+                stack.extend(node.shadow_roots[0].children)
+        return index
+
     def _find_scoped(self, doc: "cdp.dom.Node", root: Element, query: str) -> List[Element]:
         """
         Perform an XPath search scoped to a given root Element.
@@ -106,28 +157,11 @@ class Driver(BTDriver):
             cdp.dom.resolve_node(backend_node_id=backend_node_id)
         )
 
-        js: str = """
-        function(xpath) {
-            const out = [];
-            const iter = document.evaluate(
-                xpath,
-                this,
-                null,
-                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
-                null
-            );
-            for (let i = 0; i < iter.snapshotLength; i++) {
-                out.push(iter.snapshotItem(i));
-            }
-            return out;
-        }
-        """
-
         result: "cdp.runtime.RemoteObject"
         exception: Optional[dict]
         result, exception = self._tab.send(
             cdp.runtime.call_function_on(
-                function_declaration=js,
+                function_declaration=_SCOPED_XPATH_JS,
                 object_id=remote_root.object_id,
                 arguments=[cdp.runtime.CallArgument(value=query)],
                 return_by_value=False,
@@ -146,6 +180,7 @@ class Driver(BTDriver):
         if exception:
             raise RuntimeError(exception)
 
+        nodes: Optional[Dict[int, "cdp.dom.Node"]] = None
         for prop in props:
             if not hasattr(prop, "name") or not prop.name.isdigit():
                 continue
@@ -156,9 +191,9 @@ class Driver(BTDriver):
                 cdp.dom.request_node(object_id=prop.value.object_id)
             )
 
-            node: Optional["cdp.dom.Node"] = util.filter_recurse(
-                doc, lambda n: n.node_id == node_id
-            )
+            if nodes is None:
+                nodes = self._index_nodes(doc)
+            node: Optional["cdp.dom.Node"] = nodes.get(node_id)
 
             if node:
                 internal = element.create(node, self._tab, doc)
@@ -187,10 +222,9 @@ class Driver(BTDriver):
             node_ids: List[int] = self._tab.send(
                 cdp.dom.get_search_results(search_id=search_id, from_index=0, to_index=count)
             )
+            nodes = self._index_nodes(doc)
             for node_id in node_ids:
-                node: Optional["cdp.dom.Node"] = util.filter_recurse(
-                    doc, lambda n: n.node_id == node_id
-                )
+                node: Optional["cdp.dom.Node"] = nodes.get(node_id)
                 if node:
                     internal = element.create(node, self._tab, doc)
                     results.append(make_element(self, self._tab, internal))
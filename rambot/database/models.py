@@ -2,7 +2,7 @@ import json
 import typing
 from datetime import datetime
 
-from sqlalchemy import *
+from sqlalchemy import Column, Integer, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
 Base = declarative_base()
 
@@ -3,6 +3,8 @@ import os
 import sys
 import hashlib
 import random
+import atexit
+import threading
 import contextlib
 
 from functools import wraps
@@ -115,26 +117,47 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+# Shared sink for `suppress_output`, opened once instead of on every call.
+_DEVNULL = open(os.devnull, 'w')
+atexit.register(_DEVNULL.close)
+
+_suppress_lock = threading.Lock()
+_suppress_depth = 0
+_saved_streams = None
+
+
 @contextlib.contextmanager
 def suppress_output():
     """
     Context manager that temporarily suppresses the standard output (stdout)
-    and standard error (stderr) by redirecting them to os.devnull. This can
+    and standard error (stderr) by redirecting them to a shared os.devnull stream. This can
     be useful when you want to suppress any output (e.g., print statements or errors)
     within a specific block of code.
 
+    The redirection is reference-counted, so it is safe to nest and to enter from
+    several threads at once: the original streams are only restored when the last
+    block exits.
+
     Usage:
         with suppress_output():
             # Code inside this block will not produce any output
             # to stdout or stderr.
     """
-    with open(os.devnull, 'w') as fnull:
-        old_stdout, old_stderr = sys.stdout, sys.stderr
-        try:
-            sys.stdout, sys.stderr = fnull, fnull
-            yield
-        finally:
-            sys.stdout, sys.stderr = old_stdout, old_stderr
+    global _suppress_depth, _saved_streams
+
+    with _suppress_lock:
+        if _suppress_depth == 0:
+            _saved_streams = (sys.stdout, sys.stderr)
+            sys.stdout, sys.stderr = _DEVNULL, _DEVNULL
+        _suppress_depth += 1
+    try:
+        yield
+    finally:
+        with _suppress_lock:
+            _suppress_depth -= 1
+            if _suppress_depth == 0:
+                sys.stdout, sys.stderr = _saved_streams
+                _saved_streams = None
 
 
 def no_print(func):
@@ -1,9 +1,18 @@
 from .requests import (
     request
 )
-from botasaurus.soupify import soupify
+from .batch import fetch_many
 
 __all__ = [
     "request",
+    "fetch_many",
     "soupify"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # `soupify` pulls in bs4, so it is only imported when first accessed.
+    if name == "soupify":
+        from botasaurus.soupify import soupify
+        return soupify
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
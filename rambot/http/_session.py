@@ -0,0 +1,70 @@
+import threading
+
+from botasaurus_requests import Session
+
+from typing import Dict, Optional, Tuple
+
+
+# Maps the `RequestOptions` OS names to the ones expected by `botasaurus_requests`.
+_OS_MAPPING = {
+    "windows": "win",
+    "mac": "mac",
+    "linux": "lin",
+}
+
+_sessions: Dict[Tuple[str, Optional[str], Optional[str]], Session] = {}
+_lock = threading.Lock()
+
+
+def get_session(
+    browser: str = "firefox",
+    os: Optional[str] = None,
+    proxy: Optional[str] = None
+) -> Session:
+    """
+    Returns a persistent TLS session for the given browser profile and proxy.
+
+    Sessions are created lazily and kept for the lifetime of the process, so
+    consecutive requests reuse the same connections, TLS sessions and cookie jar
+    instead of paying a new handshake on every call. A separate session is kept
+    for each `(browser, os, proxy)` combination because those settings are fixed
+    once a session is built.
+
+    Args:
+        browser (str): Browser fingerprint to impersonate ("firefox" or "chrome").
+            Defaults to "firefox".
+        os (Optional[str]): Operating system to simulate ("windows", "mac" or "linux").
+            If None, `botasaurus_requests` picks one at random.
+        proxy (Optional[str]): Proxy URL used by every request sent through the session.
+
+    Returns:
+        Session: The shared `botasaurus_requests.Session` for this configuration.
+    """
+    key = (browser, _OS_MAPPING.get(os, os), proxy)
+
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            kwargs = {"browser": browser, "os": key[1]}
+            if proxy:
+                kwargs["proxy"] = proxy
+            session = _sessions[key] = Session(**kwargs)
+    return session
+
+
+def close_sessions() -> None:
+    """
+    Closes every persistent session and forgets them.
+
+    The next call to `get_session` will build fresh sessions, with empty cookie jars.
+    """
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+
+    for session in sessions:
+        session.close()
@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+
+from typing import Iterable, List, Optional, Literal, Tuple, Any
+
+from .utils import parse_response
+from .exceptions import MethodError, RequestFailure
+from .models import normalize_headers
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+async def parse_response_async(response: httpx.Response) -> Any:
+    """
+    Parses a response in the default thread pool executor.
+
+    JSON decoding and HTML tree building are CPU-bound, so running them off the
+    event loop keeps other in-flight requests progressing.
+
+    Args:
+        response (httpx.Response): The response to parse.
+
+    Returns:
+        Any: The same value `parse_response` would return for this response.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_response, response)
+
+
+async def fetch(
+    url: str,
+    *,
+    method: Literal["GET", "POST"] = "GET",
+    client: Optional[httpx.AsyncClient] = None,
+    parsed: bool = False,
+    **options: Any
+) -> Any:
+    """
+    Sends a single asynchronous HTTP request.
+
+    Unlike `request()`, this goes through `httpx` and does not impersonate a
+    browser TLS fingerprint. Use it for APIs and hosts that do not check it.
+
+    Args:
+        url (str): The target URL.
+        method (Literal["GET", "POST"]): The HTTP method to use. Defaults to "GET".
+        client (Optional[httpx.AsyncClient]): Client to send the request with. If None,
+            a temporary client is created for this call only.
+        parsed (bool): If `True`, parses the response with `parse_response`. Defaults to `False`.
+        **options: Extra arguments forwarded to `httpx.AsyncClient.request`
+            (e.g. `headers`, `params`, `json`, `data`, `cookies`, `timeout`).
+
+    Returns:
+        Any: The parsed response if `parsed` is `True`, otherwise the `httpx.Response`.
+
+    Raises:
+        MethodError: If an unsupported HTTP method is used.
+        RequestFailure: If the request fails or returns an error status.
+    """
+    if method not in ("GET", "POST"):
+        raise MethodError(method=method)
+
+    if client is None:
+        async with httpx.AsyncClient(http2=True, follow_redirects=True) as client:
+            return await fetch(url, method=method, client=client, parsed=parsed, **options)
+
+    if options.get("headers"):
+        options["headers"] = normalize_headers(options["headers"])
+
+    try:
+        response = await client.request(method, url, **options)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise RequestFailure(f"Something went wrong in request: {e}") from e
+
+    return await parse_response_async(response) if parsed else response
+
+
+async def fetch_many(
+    urls: Iterable[str],
+    *,
+    method: Literal["GET", "POST"] = "GET",
+    concurrency: int = 100,
+    parsed: bool = False,
+    **options: Any
+) -> List[Tuple[str, Any]]:
+    """
+    Fetches several URLs concurrently on the running event loop.
+
+    All requests share one `httpx.AsyncClient` (HTTP/2 enabled) whose connection
+    pool is sized to `concurrency`, and an `asyncio.Semaphore` caps how many are
+    in flight at once.
+
+    Args:
+        urls (Iterable[str]): The URLs to fetch.
+        method (Literal["GET", "POST"]): The HTTP method to use. Defaults to "GET".
+        concurrency (int): Maximum number of simultaneous requests. Defaults to 100.
+        parsed (bool): If `True`, parses each response with `parse_response`. Defaults to `False`.
+        **options: Extra arguments forwarded to every `httpx.AsyncClient.request` call.
+
+    Returns:
+        List[Tuple[str, Any]]: `(url, response)` pairs in the order of `urls`. If a
+            request failed, the raised exception is returned in place of the response.
+
+    Example:
+        ```python
+        import asyncio
+        from rambot.http.async_client import fetch_many
+
+        results = asyncio.run(fetch_many(urls, concurrency=50, parsed=True))
+        ```
+    """
+    urls = list(urls)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(http2=True, limits=limits, follow_redirects=True) as client:
+
+        async def bounded_fetch(url: str) -> Any:
+            async with semaphore:
+                try:
+                    return await fetch(url, method=method, client=client, parsed=parsed, **dict(options))
+                except Exception as e:
+                    logger.warning("Failed to fetch \"{}\": {}", url, e)
+                    return e
+
+        results = await asyncio.gather(*(bounded_fetch(url) for url in urls))
+
+    return list(zip(urls, results))
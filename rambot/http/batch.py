@@ -0,0 +1,92 @@
+import os
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Literal, Tuple, Any
+
+from .requests import request
+from .models import RequestOptions
+from ..logging_config import get_logger
+
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer
+
+logger = get_logger(__name__)
+
+
+# Default number of worker threads used by `fetch_many`.
+MAX_WORKERS = int(os.getenv("RAMBOT_MAX_WORKERS", "16"))
+
+
+def fetch_many(
+    urls: Iterable[str],
+    *,
+    method: Literal["GET", "POST"] = "GET",
+    options: Optional[RequestOptions] = None,
+    max_workers: Optional[int] = None,
+    max_retry: Optional[int] = 5,
+    retry_wait: Optional[int] = 5,
+    parsed: bool = False,
+    strainer: Optional["SoupStrainer"] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Fetches several URLs concurrently with a bounded pool of worker threads.
+
+    Each URL is sent through `request()` with the same options, so the calls share
+    the persistent session of their browser profile. Results are yielded as soon
+    as they complete, which means they do not follow the order of `urls`.
+
+    This is meant for plain HTTP requests only: the browser driver must not be
+    shared between threads.
+
+    Args:
+        urls (Iterable[str]): The URLs to fetch.
+        method (Literal["GET", "POST"]): The HTTP method to use. Defaults to "GET".
+        options (Optional[RequestOptions]): Request options applied to every URL.
+        max_workers (Optional[int]): Maximum number of concurrent requests. Defaults to
+            the `RAMBOT_MAX_WORKERS` environment variable, or 16.
+        max_retry (Optional[int]): Maximum number of retry attempts per URL. Defaults to 5.
+        retry_wait (Optional[int]): Delay (in seconds) between retry attempts. Defaults to 5.
+        parsed (bool): If `True`, parses each response with `parse_response`. Defaults to `False`.
+        strainer (Optional[SoupStrainer]): Restricts HTML parsing to matching tags.
+
+    Yields:
+        Tuple[str, Any]: The URL and its response. If the request failed, the raised
+            exception is yielded in place of the response so that one failure does not
+            abort the whole batch.
+
+    Example:
+        ```python
+        for url, response in fetch_many(urls, max_workers=8, parsed=True):
+            if isinstance(response, Exception):
+                continue
+            ...
+        ```
+    """
+    options = options or {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                request,
+                method=method,
+                url=url,
+                options=options,
+                max_retry=max_retry,
+                retry_wait=retry_wait,
+                parsed=parsed,
+                strainer=strainer
+            ): url
+            for url in urls
+        }
+        try:
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning("Failed to fetch \"{}\": {}", url, e)
+                    result = e
+                yield url, result
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,183 @@
+import time
+import sqlite3
+import hashlib
+import threading
+
+import orjson
+from botasaurus_requests import Response
+from botasaurus_requests.cookies import RequestsCookieJar
+from botasaurus_requests.toolbelt import CaseInsensitiveDict
+
+from typing import Optional, Dict, Any
+
+
+# Default location of the SQLite cache file.
+DEFAULT_CACHE_PATH = ".rambot_cache.sqlite"
+# Default lifetime of a cached response, in seconds (24 hours).
+DEFAULT_EXPIRE_AFTER = 24 * 60 * 60
+
+_connection: Optional[sqlite3.Connection] = None
+_expire_after: Optional[float] = DEFAULT_EXPIRE_AFTER
+_lock = threading.Lock()
+
+
+def enable_cache(
+    path: str = DEFAULT_CACHE_PATH,
+    expire_after: Optional[float] = DEFAULT_EXPIRE_AFTER
+) -> None:
+    """
+    Enables the on-disk response cache used by `request()`.
+
+    Once enabled, successful responses are stored in a SQLite database and served
+    from it on the next identical request instead of hitting the network. This is
+    meant for development, where the same pages are fetched on every run.
+
+    Args:
+        path (str): Path of the SQLite cache file. Defaults to ".rambot_cache.sqlite".
+        expire_after (Optional[float]): Lifetime of a cached response, in seconds.
+            If None, cached responses never expire. Defaults to 24 hours.
+    """
+    global _connection, _expire_after
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+
+        _connection = sqlite3.connect(path, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers BLOB, "
+            "body BLOB, is_text INTEGER, created REAL)"
+        )
+        _connection.commit()
+        _expire_after = expire_after
+
+
+def disable_cache() -> None:
+    """
+    Disables the response cache. Cached entries are kept on disk.
+    """
+    global _connection
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+def clear_cache() -> None:
+    """
+    Deletes every cached response. Does nothing if the cache is not enabled.
+    """
+    with _lock:
+        if _connection is not None:
+            _connection.execute("DELETE FROM responses")
+            _connection.commit()
+
+
+def is_cache_enabled() -> bool:
+    """
+    Returns:
+        bool: Whether the response cache is currently enabled.
+    """
+    return _connection is not None
+
+
+def cache_key(method: str, url: str, options: Dict[str, Any]) -> str:
+    """
+    Builds the cache key of a request.
+
+    The key covers the method, the URL, the query parameters (sorted, so their
+    order does not matter) and a hash of the request body.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The target URL.
+        options (Dict[str, Any]): The request options.
+
+    Returns:
+        str: A hexadecimal key identifying the request.
+    """
+    params = options.get("params") or {}
+    body = options.get("json", options.get("data"))
+    if isinstance(body, str):
+        body = body.encode()
+    elif body is not None and not isinstance(body, bytes):
+        body = orjson.dumps(body, option=orjson.OPT_SORT_KEYS, default=str)
+
+    key = hashlib.sha256()
+    key.update(method.upper().encode())
+    key.update(b"\0")
+    key.update(str(url).encode())
+    key.update(b"\0")
+    key.update(orjson.dumps(sorted(params.items()), default=str))
+    key.update(b"\0")
+    key.update(hashlib.sha256(body or b"").digest())
+    return key.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Response]:
+    """
+    Looks up a cached response.
+
+    Args:
+        key (str): The cache key returned by `cache_key`.
+
+    Returns:
+        Optional[Response]: The cached response, or None if the cache is disabled
+            or has no fresh entry for this key.
+    """
+    with _lock:
+        if _connection is None:
+            return None
+        row = _connection.execute(
+            "SELECT url, status, headers, body, is_text, created FROM responses WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+    if row is None:
+        return None
+
+    url, status, headers, body, is_text, created = row
+    if _expire_after is not None and time.time() - created > _expire_after:
+        return None
+
+    return Response(
+        url=url,
+        status_code=status,
+        headers=CaseInsensitiveDict(orjson.loads(headers)),
+        cookies=RequestsCookieJar(),
+        raw=body.decode() if is_text else body,
+        is_utf8=bool(is_text)
+    )
+
+
+def store_response(key: str, response: Response) -> None:
+    """
+    Stores a response in the cache. Does nothing if the cache is disabled or the
+    response body is not available as text or bytes.
+
+    Args:
+        key (str): The cache key returned by `cache_key`.
+        response (Response): The response to store.
+    """
+    raw = response.raw
+    if not isinstance(raw, (str, bytes)):
+        return
+
+    is_text = isinstance(raw, str)
+    row = (
+        key,
+        response.url,
+        response.status_code,
+        orjson.dumps(dict(response.headers)),
+        raw.encode() if is_text else raw,
+        int(is_text),
+        time.time()
+    )
+
+    with _lock:
+        if _connection is None:
+            return
+        _connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+        _connection.commit()
@@ -1,6 +1,10 @@
 from typing import Literal
 
 
+ALLOWED_METHODS = Literal["GET", "POST"]
+_ALLOWED_METHODS_STR = ", ".join(ALLOWED_METHODS.__args__)
+
+
 class BaseRequestException(Exception):
     """
     Base exception class for handling general request-related errors.
@@ -18,8 +22,8 @@ class BaseRequestException(Exception):
         Args:
             message (str): The custom error message. Defaults to "An exception occurred".
         """
+        super().__init__(message)
         self.message = message
-        super().__init__(self.__str__())
 
     def __str__(self):
         """
@@ -48,8 +52,7 @@ class RequestFailure(BaseRequestException):
         Args:
             message (str): The custom error message. Defaults to "The request has failed".
         """
-        self.message = message
-        super().__init__(self.__str__())
+        super().__init__(message)
 
 
 class MethodError(BaseRequestException):
@@ -62,14 +65,15 @@ class MethodError(BaseRequestException):
     Attributes:
         method (str): The unsupported HTTP method that caused the error.
     """
-    def __str__(self):
+    def __init__(self, method: str):
         """
-        Returns the string representation of the exception, including the unsupported method.
+        Initializes the exception with the unsupported method.
 
-        Returns:
-            str: The message indicating the unsupported method and the allowed methods.
+        Args:
+            method (str): The unsupported HTTP method.
         """
-        return f"Unsupported HTTP method: '{self.method}'. Allowed methods are: [{', '.join(Literal["GET", "POST"].__args__)}]"
+        self.method = method
+        super().__init__(f"Unsupported HTTP method: '{method}'. Allowed methods are: [{_ALLOWED_METHODS_STR}]")
 
 
 class OptionsError(BaseRequestException):
@@ -108,8 +112,8 @@ class ParsingError(Exception):
         Args:
             message (str): The custom error message. Defaults to "The parsing has failed".
         """
+        super().__init__(message)
         self.message = message
-        super().__init__(self.__str__())
 
     def __str__(self):
         """
@@ -7,16 +7,21 @@ from requests.exceptions import RequestException
 
 from .exceptions import MethodError, RequestFailure, OptionsError
 from .models import RequestOptions, normalize_headers
+from ._session import get_session
+from .cache import is_cache_enabled, cache_key, get_cached_response, store_response
 from ..helpers import no_print
 
 from pydantic import HttpUrl
 
-from typing import Optional, Literal, Union, Dict, Any
-from bs4 import BeautifulSoup
-from botasaurus_requests import Response
+from typing import TYPE_CHECKING, Optional, Literal, Union, Dict, Any
+from selectolax.lexbor import LexborHTMLParser
+from botasaurus_requests import Response, reqs
 
 import json
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+
 logger = get_logger(__name__)
 
 
@@ -27,14 +32,20 @@ def request(
     options: RequestOptions = {}, 
     max_retry: Optional[int] = 5, 
     retry_wait: Optional[int] = 5, 
-    parsed: bool = False
-) -> Union[Dict[str, Any], BeautifulSoup, str, Response]:
+    parsed: bool = False,
+    strainer: Optional["SoupStrainer"] = None
+) -> Union[Dict[str, Any], LexborHTMLParser, "BeautifulSoup", str, Response]:
     """
     Sends an HTTP request using the specified method and options.
 
     This function supports automatic retries and optional response parsing. 
     It wraps the request execution with error handling and logging.
 
+    Requests are sent through a persistent session shared by every call with the
+    same `browser`, `os` and proxy options, so connections, TLS sessions and
+    cookies are reused across calls. When the response cache is enabled (see
+    `rambot.http.cache.enable_cache`), identical requests are answered from disk.
+
     Args:
         method (Literal["GET", "POST"]): The HTTP method to use (e.g., "GET", "POST").
         url (HttpUrl): The target URL for the HTTP request.
@@ -45,9 +56,11 @@ def request(
         retry_wait (Optional[int], optional): Delay (in seconds) between retry attempts. Defaults to 5.
         raw (bool, optional): If `True`, returns the raw HTTP response instead of parsing it.
             Defaults to `False`.
+        strainer (Optional[SoupStrainer], optional): When parsing HTML, only build the
+            matching subset of the document with BeautifulSoup. Defaults to `None`.
 
     Returns:
-        Union[Dict[str, Any], BeautifulSoup, str, Response]: The parsed response if `raw` is `False`, otherwise the raw HTTP response.
+        Union[Dict[str, Any], LexborHTMLParser, BeautifulSoup, str, Response]: The parsed response if `raw` is `False`, otherwise the raw HTTP response.
 
     Raises:
         MethodError: If an unsupported HTTP method is used.
@@ -75,14 +88,14 @@ def request(
         ```
     """
     
-    logger.debug(f"Trying to load \"{url}\" ...")
+    logger.debug("Trying to load \"{}\" ...", url)
     
     @request_decorator(
         max_retry=max_retry,
         retry_wait=retry_wait,
         output=None,
         create_error_logs=False,
-        output_formats=[Union[Dict[str, Any], BeautifulSoup, str, Response]],
+        output_formats=[Union[Dict[str, Any], LexborHTMLParser, "BeautifulSoup", str, Response]],
         raise_exception=True,
         close_on_crash=True,
         must_raise_exceptions=[MethodError, OptionsError]
@@ -99,7 +112,7 @@ def request(
             data (RequestOptions): The options dictionary containing request parameters, headers, etc.
 
         Returns:
-            Union[Dict[str, Any], BeautifulSoup, str, Response]: The response from the server, either parsed or raw based on the `raw` flag.
+            Union[Dict[str, Any], LexborHTMLParser, BeautifulSoup, str, Response]: The response from the server, either parsed or raw based on the `raw` flag.
 
         Raises:
             MethodError: If an unsupported HTTP method is used.
@@ -107,6 +120,9 @@ def request(
             OptionsError: If there are issues with the provided options.
         """
         try:
+            # Work on a copy: the decorator hands the same options to every retry.
+            data = dict(data)
+
             if "headers" not in options or options["headers"] is None:
                 data["headers"] = {}
             
@@ -115,16 +131,36 @@ def request(
             
             data["headers"] = normalize_headers(data.get("headers", {}))
             
+            key = cache_key(method, url, data) if is_cache_enabled() else None
+            if key is not None:
+                cached = get_cached_response(key)
+                if cached is not None:
+                    logger.debug("Serving \"{}\" from cache", url)
+                    return parse_response(response=cached, strainer=strainer) if parsed else cached
+
+            proxy = data.pop("proxies", None)
+            if isinstance(proxy, dict):
+                proxy = proxy.get("http", proxy.get("https"))
+
+            session = get_session(
+                browser=data.pop("browser", None) or "firefox",
+                os=data.pop("os", None),
+                proxy=proxy
+            )
+
             if method == "GET":
-                response = request.get(url, **data)
+                response = reqs.get(url, session=session, referer="https://www.google.com/", **data)
             elif method == "POST":
-                response = request.post(url, **data)
+                response = reqs.post(url, session=session, **data)
             else:
                 raise MethodError(method=method)
 
             response.raise_for_status()
 
-            return parse_response(response=response) if parsed else response
+            if key is not None:
+                store_response(key, response)
+
+            return parse_response(response=response, strainer=strainer) if parsed else response
 
         except MethodError as e:
             raise e
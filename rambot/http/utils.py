@@ -1,11 +1,70 @@
+import os
+
+import orjson
 from botasaurus_requests import Response
-from botasaurus.soupify import soupify, BeautifulSoup
-from typing import Union, Dict, Any
+from selectolax.lexbor import LexborHTMLParser
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
 
 from .exceptions import ParsingError
 
 
-def parse_response(response: Response) -> Union[Dict[str, Any], BeautifulSoup, str, Response]:
+# HTML backend used by `parse_response`: "lexbor" (default) or "bs4".
+HTML_PARSER = os.getenv("RAMBOT_HTML_PARSER", "lexbor").lower()
+
+# JSON decoder used by `parse_response`; swap it out to change the implementation.
+_json_loader = orjson.loads
+
+
+def _body(response: Response) -> Union[str, bytes]:
+    """
+    Returns the response body as the client stored it, without decoding or re-encoding.
+
+    botasaurus keeps UTF-8 bodies as `str` and everything else as `bytes` in `raw`;
+    both parsers accept either, and bytes let them detect the encoding themselves.
+    Other clients (e.g. httpx) fall back to their `content` bytes.
+    """
+    raw = getattr(response, "raw", None)
+    if isinstance(raw, (str, bytes)):
+        return raw
+    return response.content
+
+
+def _parse_json(response: Response, strainer: Optional["SoupStrainer"]) -> Dict[str, Any]:
+    try:
+        return _json_loader(_body(response))
+    except ValueError as e:
+        raise ParsingError(f"Error parsing JSON: {e}") from e
+
+
+def _parse_html(response: Response, strainer: Optional["SoupStrainer"]) -> Union[LexborHTMLParser, "BeautifulSoup"]:
+    try:
+        if strainer is not None or HTML_PARSER == "bs4":
+            # Imported on first use: bs4 is only needed for this fallback.
+            from bs4 import BeautifulSoup
+            return BeautifulSoup(_body(response), "lxml", parse_only=strainer)
+        return LexborHTMLParser(_body(response))
+    except Exception as e:
+        raise ParsingError(f"Error parsing HTML: {e}") from e
+
+
+def _parse_text(response: Response, strainer: Optional["SoupStrainer"]) -> str:
+    return response.text
+
+
+# Parser for each supported MIME type; anything else is returned as text.
+_DISPATCH = {
+    "application/json": _parse_json,
+    "text/html": _parse_html,
+}
+
+
+def parse_response(
+    response: Response,
+    strainer: Optional["SoupStrainer"] = None
+) -> Union[Dict[str, Any], LexborHTMLParser, "BeautifulSoup", str, Response]:
     """
     Parses the HTTP response content based on its content type.
 
@@ -13,30 +72,25 @@ def parse_response(response: Response) -> Union[Dict[str, Any], BeautifulSoup, s
     the body accordingly. It supports parsing JSON, HTML, and plain text responses.
     If the response contains an unsupported content type, the raw response text is returned.
 
+    HTML is parsed with selectolax's Lexbor backend unless the `RAMBOT_HTML_PARSER`
+    environment variable is set to `bs4` or a `strainer` is given, in which case a
+    `BeautifulSoup` object built with the `lxml` backend is returned.
+
     Args:
         response (Response): The HTTP response object to be parsed.
+        strainer (Optional[SoupStrainer]): Restricts BeautifulSoup parsing to the matching
+            tags, e.g. `SoupStrainer("div", class_="listing")`. Build it once and reuse it.
 
     Returns:
-        Union[Dict[str, Any], BeautifulSoup, str, Response]:
+        Union[Dict[str, Any], LexborHTMLParser, BeautifulSoup, str, Response]:
             - If the content is JSON, returns a dictionary parsed from the JSON response.
-            - If the content is HTML, returns a `BeautifulSoup` object for parsing and navigating the HTML.
+            - If the content is HTML, returns a `LexborHTMLParser` (or `BeautifulSoup` when
+              `RAMBOT_HTML_PARSER=bs4` or a strainer is given) for querying the document.
             - If the content is plain text, returns the raw text.
             - In case of unsupported content type, returns the raw text of the response.
 
     Raises:
         ParsingError: If there is an error parsing the response content, such as invalid JSON or HTML.
     """
-    content_type = response.headers.get("Content-Type", "").lower()
-
-    if "application/json" in content_type:
-        try:
-            return response.json()
-        except ValueError as e:
-            raise ParsingError(f"Error parsing JSON: {e}") from e
-    elif "text/html" in content_type:
-        try:
-            return soupify(response)
-        except Exception as e:
-            raise ParsingError(f"Error parsing HTML: {e}") from e
-    else:
-        return response.text
+    mime = response.headers.get("Content-Type", "").partition(";")[0].strip().lower()
+    return _DISPATCH.get(mime, _parse_text)(response, strainer)
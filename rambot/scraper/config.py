@@ -1,6 +1,24 @@
+import types
 import typing
 
 
+# Attributes forwarded to the Driver. Those left as None fall back
+# to the Driver's own defaults.
+_DRIVER_KWARGS_KEYS = (
+    "headless",
+    "proxy",
+    "profile",
+    "tiny_profile",
+    "block_images",
+    "block_images_and_css",
+    "extensions",
+    "arguments",
+    "user_agent",
+    "lang",
+    "beep",
+)
+
+
 class ScraperConfig:
     """
     Configuration class for the scraper.
@@ -14,13 +32,14 @@ class ScraperConfig:
         profile (str, optional): The profile to use for the browser session, if any.
         tiny_profile (bool): Whether to use a minimal browser profile to optimize speed and resource usage.
         block_images (bool): Whether to block loading images in the browser for faster scraping.
-        block_images_and_css (bool): Whether to block both images and CSS for maximum speed.
+        block_images_and_css (bool): Whether to block images, CSS and fonts for maximum speed. Enabled by default.
         wait_for_complete_page_load (bool): Whether to wait for the entire page to load before scraping.
         extensions (List[str]): A list of browser extension paths to load during the scraping process.
         arguments (List[str]): A list of command-line arguments to pass to the browser.
         user_agent (str, optional): The custom user agent string to use for requests.
         lang (str, optional): The language setting for the scraper.
         beep (bool): Whether to play a beep sound when the scraping is complete or encounters an error.
+        cache_responses (bool): Whether to cache `rambot.http.request` responses on disk between runs.
     """
     def __init__(
         self,
@@ -29,13 +48,14 @@ class ScraperConfig:
         profile: str = None,
         tiny_profile: bool = False,
         block_images: bool = False,
-        block_images_and_css: bool = False,
+        block_images_and_css: bool = True,
         wait_for_complete_page_load: bool = False,
-        extensions: typing.List[str] = [],
-        arguments: typing.List[str] = [],
+        extensions: typing.Optional[typing.List[str]] = None,
+        arguments: typing.Optional[typing.List[str]] = None,
         user_agent: str = None,
         lang: str = None,
         beep: bool = False,
+        cache_responses: bool = False,
     ):
         """
         Initializes the ScraperConfig object with the specified configuration options.
@@ -46,7 +66,9 @@ class ScraperConfig:
             profile (str, optional): The profile to use for the browser session. Defaults to None.
             tiny_profile (bool, optional): Whether to use a minimal browser profile. Defaults to False.
             block_images (bool, optional): Whether to block images in the browser. Defaults to False.
-            block_images_and_css (bool, optional): Whether to block both images and CSS. Defaults to False.
+            block_images_and_css (bool, optional): Whether to block images, CSS and fonts. Most scrapers only
+                read the DOM, so this is on by default; set it to False for pages that need assets to render.
+                Defaults to True.
             wait_for_complete_page_load (bool, optional): Whether to wait for the page to load completely.
                 Defaults to False.
             extensions (List[str], optional): A list of browser extension paths to load. Defaults to an empty list.
@@ -54,6 +76,8 @@ class ScraperConfig:
             user_agent (str, optional): A custom user agent string for the scraper. Defaults to None.
             lang (str, optional): The language setting for the scraper. Defaults to None.
             beep (bool, optional): Whether to play a beep sound when the scraping process is complete. Defaults to False.
+            cache_responses (bool, optional): Whether to cache HTTP responses in a local SQLite file,
+                useful while developing a scraper. Defaults to False.
         """
         
         self.headless = headless
@@ -63,8 +87,35 @@ class ScraperConfig:
         self.block_images = block_images
         self.block_images_and_css = block_images_and_css
         self.wait_for_complete_page_load = wait_for_complete_page_load
-        self.extensions = extensions
-        self.arguments = arguments
+        self.extensions = list(extensions) if extensions is not None else []
+        self.arguments = list(arguments) if arguments is not None else []
         self.user_agent = user_agent
         self.lang = lang
         self.beep = beep
+        self.cache_responses = cache_responses
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_driver_kwargs":
+            # Any change to the config invalidates the cached Driver arguments.
+            object.__setattr__(self, "_driver_kwargs", None)
+
+    def to_driver_kwargs(self) -> typing.Mapping[str, typing.Any]:
+        """
+        Returns the keyword arguments to build the browser Driver with.
+
+        Options left as None are omitted so the Driver applies its own defaults. The
+        mapping is built on first use, cached until an attribute is reassigned, and
+        read-only so callers cannot alter the cached copy.
+
+        Returns:
+            Mapping[str, Any]: The Driver keyword arguments.
+        """
+        if self._driver_kwargs is None:
+            driver_kwargs = {}
+            for key in _DRIVER_KWARGS_KEYS:
+                value = getattr(self, key)
+                if value is not None:
+                    driver_kwargs[key] = value
+            self._driver_kwargs = types.MappingProxyType(driver_kwargs)
+        return self._driver_kwargs
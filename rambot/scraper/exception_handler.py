@@ -6,9 +6,21 @@ from loguru import logger
 
 
 class ExceptionHandler:
-    def __init__(self, must_raise_exceptions: typing.List[typing.Type[Exception]] = [Exception]):
+    def __init__(self, must_raise_exceptions: typing.Optional[typing.List[typing.Type[Exception]]] = None):
         self.logger = logger
-        self.must_raise = must_raise_exceptions
+        self.must_raise = must_raise_exceptions if must_raise_exceptions is not None else [Exception]
+        # Resolved once; lazy so the traceback is only formatted if the record is emitted.
+        self._log_warning = logger.opt(lazy=True).warning
+
+    @property
+    def must_raise(self) -> typing.Tuple[typing.Type[Exception], ...]:
+        """Exception types that are re-raised after being logged."""
+        return self._must_raise
+
+    @must_raise.setter
+    def must_raise(self, exceptions: typing.Iterable[typing.Type[Exception]]) -> None:
+        # Stored as a tuple so `handle` can test them with a single isinstance call.
+        self._must_raise = tuple(exceptions)
 
     def handle(self, e: Exception) -> None:
         """
@@ -19,13 +31,14 @@ class ExceptionHandler:
             e (Exception): The exception to handle.
         """
         
-        frame = inspect.currentframe().f_back
-        function_name = frame.f_code.co_name
-
-        error_message = f"Error in {function_name}: {str(e)}"
-        traceback_details = traceback.format_exc()
+        function_name = inspect.currentframe().f_back.f_code.co_name
 
-        self.logger.warning(f"{error_message}\n{traceback_details}")
+        self._log_warning(
+            "Error in {}: {}\n{}",
+            lambda: function_name,
+            lambda: e,
+            traceback.format_exc
+        )
 
-        if any(isinstance(e, exc_type) for exc_type in self.must_raise):
+        if isinstance(e, self._must_raise):
             raise e
@@ -1,7 +1,7 @@
 import os
 import subprocess
 
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Iterable
 from ...types import IInterceptor, Request
 
 
@@ -11,7 +11,7 @@ class Interceptor(IInterceptor):
 
     This class manages the lifecycle of a mitmproxy process to capture network 
     traffic generated by the scraper's browser. Traffic is logged to a temporary 
-    JSONL file for post-processing.
+    length-prefixed MessagePack file for post-processing.
     """
 
     def start(self) -> None:
@@ -50,7 +50,7 @@ class Interceptor(IInterceptor):
         Stop the interception process and clean up resources.
 
         - Kills the mitmdump process.
-        - Deletes the temporary JSONL file containing captured requests.
+        - Deletes the temporary capture file containing captured requests.
         """
         try:
             os.remove(self._requests_path)
@@ -60,23 +60,30 @@ class Interceptor(IInterceptor):
 
     def requests(
         self,
-        predicate: Optional[Callable[[Request], bool]] = None
+        predicate: Optional[Callable[[Request], bool]] = None,
+        status_codes: Optional[Iterable[int]] = None
     ) -> List[Request]:
         """
         Retrieve and filter captured network requests.
 
-        Parses the temporary storage file and applies an optional filter 
+        Parses the temporary storage file and applies the optional filters 
         to the resulting list of Request objects.
 
         Args:
             predicate (Optional[Callable[[Request], bool]]): A function that returns 
                 True for requests that should be included in the results.
+            status_codes (Optional[Iterable[int]]): Response status codes to keep, 
+                e.g. `{200, 204}`. Checked before the predicate.
 
         Returns:
             List[Request]: A list of captured and filtered Request objects.
         """
         requests_to_filter = self._requests()
 
+        if status_codes is not None:
+            codes = status_codes if isinstance(status_codes, (set, frozenset)) else frozenset(status_codes)
+            requests_to_filter = [req for req in requests_to_filter if req.response.status in codes]
+
         if predicate is None:
             return requests_to_filter
         
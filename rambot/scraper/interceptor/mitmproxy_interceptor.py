@@ -1,6 +1,7 @@
-import json
 import os
 
+import msgpack
+
 from mitmproxy import ctx, http
 
 
@@ -55,8 +56,9 @@ class MITMProxyInterceptor:
             }
         }
         try:
-            with open(self.requests_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            payload = msgpack.packb(entry, use_bin_type=True)
+            with open(self.requests_path, "ab") as f:
+                f.write(len(payload).to_bytes(4, "little") + payload)
         except Exception as e:
             ctx.log.warn(f"[Interceptor] Failed to log request/response: {e}")
 
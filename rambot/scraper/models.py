@@ -1,11 +1,26 @@
+import os
+import sys
 import typing
 import hashlib
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from enum import Enum
 
 
+@lru_cache(maxsize=1)
+def _format_date(ordinal: int) -> str:
+    day = date.fromordinal(ordinal)
+    return f"{day.year:04d}-{day.month:02d}-{day.day:02d}"
+
+
+def _today_str() -> str:
+    """Returns today's date as YYYY-MM-DD, formatted once per day."""
+    return _format_date(date.today().toordinal())
+
+
 class Document(BaseModel):
     """
     A model representing a document with a unique link.
@@ -31,7 +46,7 @@ class Document(BaseModel):
             Computes a hash value for the document based on its link, making it hashable.
     """
 
-    link: str = Field("", alias="link")
+    link: str = ""
     
 
     def to_dict(self) -> typing.Dict[str, typing.Any]:
@@ -87,61 +102,68 @@ class Document(BaseModel):
         return hash(self.link)
 
 
-class Mode(BaseModel):
+@dataclass
+class Mode:
     """
     A model representing a mode of operation for a scraper or process.
 
     This class defines the configuration and parameters associated with a specific mode,
     including the function to be executed, input handling, logging options, and a save function.
+    Modes are registered once and read on every run, so this is a plain dataclass rather
+    than a validated pydantic model.
 
     Attributes:
         name (str): The name of the mode.
         func (Optional[Callable]): An optional function to execute in this mode.
+        wrapped (Optional[Callable]): `func` wrapped by `scrape`, built once when the mode is bound.
         input (Optional[Union[str, Callable]]): The input for the mode, which can be a string or a callable that returns a list of dictionaries.
         save (Optional[Callable[[Any], None]]): An optional function to save the results of this mode.
-        document_input (Optional[Type[Document]]): The document input type associated with the mode.
+        document_output (Type[Document]): The document type produced by the mode.
+        expected_input_type (Optional[Type]): The document type expected as input by the mode.
         log_directory (str): The file path to store logs, defaults to the current directory.
         enable_file_logging (bool): Whether to save logs for this mode.
         log_file_name (Optional[str]): The output path for logs, can be None to use a default path.
+        stream_input (bool): Whether to stream the input file one document at a time instead of loading it whole.
+        batch_size (Optional[int]): If set, the mode function receives lists of up to this many documents instead of one at a time.
+        output_format (Literal["json", "jsonl"]): Format of the output file. "jsonl" writes one document per line as each is collected instead of the whole list at the end.
     """
-    name: str = Field(alias="name")
+    name: str
     
-    func: typing.Optional[typing.Callable] = Field(None, alias="func")
-    input: typing.Optional[typing.Union[str, typing.Callable[[], typing.List[typing.Dict[str, typing.Any]]]]] = Field(None, alias="input")
-    save: typing.Optional[typing.Callable[[typing.Any], None]] = Field(None, alias="save")
-    # document_input: typing.Optional[typing.Type[Document]] = Field(None, alias="document_input")
+    func: typing.Optional[typing.Callable] = None
+    wrapped: typing.Optional[typing.Callable] = None
+    input: typing.Optional[typing.Union[str, typing.Callable[[], typing.List[typing.Dict[str, typing.Any]]]]] = None
+    save: typing.Optional[typing.Callable[[typing.Any], None]] = None
     
-    document_output: typing.Type[Document] = Field(Document, alias="document_output")
-    expected_input_type: typing.Optional[typing.Type] = Field(None, alias="expected_input_type")
+    document_output: typing.Type[Document] = Document
+    expected_input_type: typing.Optional[typing.Type] = None
     
-    log_directory: str   = Field(".", alias="log_directory")
-    enable_file_logging: bool = Field(False, alias="enable_file_logging")
-    log_file_name: typing.Optional[str] = Field(None, alias="log_file_name")
+    log_directory: str = "."
+    enable_file_logging: bool = False
+    log_file_name: typing.Optional[str] = None
+    stream_input: bool = False
+    batch_size: typing.Optional[int] = None
+    output_format: typing.Literal["json", "jsonl"] = "json"
     
-    @field_validator("log_file_name", mode="before")
-    @classmethod
-    def set_default_logs(cls, v, values):
+    def __post_init__(self) -> None:
         """
         Sets a default log output path if not provided.
 
-        If `log_file_name` is not provided, the function sets the default log path based on the
-        mode name and the current date, appending it to the specified directory path.
-
-        Args:
-            v (str or None): The provided value for the logs output path.
-            values (dict): The values from the mode configuration.
+        If `log_file_name` is not provided, the default log path is built from the
+        mode name and the current date. In both cases the file name is placed inside
+        `log_directory`.
+        """
+        if self.log_file_name is None:
+            self.log_file_name = os.path.join(self.log_directory, f"{self.name}_{_today_str()}.log")
+        else:
+            self.log_file_name = os.path.join(self.log_directory, self.log_file_name)
 
+    @property
+    def output_file(self) -> str:
+        """
         Returns:
-            str: The default or provided log output path.
+            str: The file the mode results are written to, e.g. "listing.json".
         """
-        path = values.data.get("log_directory", ".")
-        
-        if v is None:
-            mode = values.data.get('name')
-            today = date.today().strftime("%Y-%m-%d")
-            return f"{path}/{mode}_{today}.log"
-        
-        return f"{path}/{v}"
+        return f"{self.name}.{self.output_format}"
 
 
 class ScraperModeManager:
@@ -152,9 +174,10 @@ class ScraperModeManager:
     It also handles the retrieval of associated functions and configurations.
 
     Attributes:
-        _modes (dict): A dictionary holding the registered modes.
+        _modes (Dict[str, Mode]): A dictionary holding the registered modes, shared by every instance.
     """
-    _modes = {}
+    _modes: typing.Dict[str, Mode] = {}
+    _all_cache: typing.Optional[typing.Tuple[str, ...]] = None
     _output_registry: typing.Dict[typing.Type[Document], str] = {}
 
     @classmethod
@@ -162,13 +185,17 @@ class ScraperModeManager:
         cls,
         name: str, 
         func: typing.Optional[typing.Callable] = None,
+        wrapped: typing.Optional[typing.Callable] = None,
         document_output: typing.Type[Document] = Document,
         expected_input_type: typing.Optional[typing.Type] = None,
         input: typing.Optional[typing.Union[str, typing.Callable]] = None,
         save: typing.Optional[typing.Callable[[typing.Any], None]] = None,
         enable_file_logging: bool = False,
         log_file_name: typing.Optional[str] = None,
-        log_directory: str = '.'
+        log_directory: str = '.',
+        stream_input: bool = False,
+        batch_size: typing.Optional[int] = None,
+        output_format: typing.Literal["json", "jsonl"] = "json"
     ):
         """
         Registers a new mode for the scraper.
@@ -179,38 +206,53 @@ class ScraperModeManager:
         Args:
             name (str): The name of the mode.
             func (Optional[Callable]): An optional function to associate with the mode.
+            wrapped (Optional[Callable]): The function wrapped by `scrape`, reused by every run.
             input (Optional[Union[str, Callable]]): The input for the mode, which can be a string or a callable.
             save (Optional[Callable[[Any], None]]): A function to save the results of this mode.
             document_input (Optional[Type[Document]]): The document type associated with the mode.
             enable_file_logging (bool): Whether to save logs for this mode.
             log_file_name (Optional[str]): The output path for logs.
             log_directory (str): The directory path for logs, defaults to the current directory.
+            stream_input (bool): Whether to stream the input file instead of loading it whole.
+            batch_size (Optional[int]): Number of documents passed to the mode function per call.
+            output_format (Literal["json", "jsonl"]): Format of the mode output file.
         """
         if document_output and issubclass(document_output, Document):
             cls._output_registry[document_output] = name
         
-        if name not in cls._modes:
+        # Interned so lookups with the CLI-provided mode name hit on identity.
+        name = sys.intern(name)
+        if cls._modes.get(name) is None:
+            cls._all_cache = None
             cls._modes[name] = Mode(
                 name=name,
                 func=func, 
+                wrapped=wrapped,
                 document_output=document_output,
                 expected_input_type=expected_input_type,
                 input=input, 
                 save=save,
                 enable_file_logging=enable_file_logging,
                 log_file_name=log_file_name,
-                log_directory=log_directory
+                log_directory=log_directory,
+                stream_input=stream_input,
+                batch_size=batch_size,
+                output_format=output_format
             )
 
     @classmethod
-    def all(cls):
+    def all(cls) -> typing.Tuple[str, ...]:
         """
-        Returns the list of all registered modes.
+        Returns the names of all registered modes.
+
+        The tuple is cached and rebuilt only after a new mode is registered.
 
         Returns:
-            list: A list of mode names.
+            tuple: The mode names, in registration order.
         """
-        return list(cls._modes.keys())
+        if cls._all_cache is None:
+            cls._all_cache = tuple(cls._modes)
+        return cls._all_cache
 
     @classmethod
     def validate(cls, mode: str):
@@ -240,8 +282,10 @@ class ScraperModeManager:
         Raises:
             ValueError: If the mode is not registered.
         """
-        cls.validate(mode)
-        return cls._modes[mode]
+        mode_info = cls._modes.get(mode)
+        if mode_info is None:
+            raise ValueError(f"Mode '{mode}' non reconnu. Modes disponibles: {cls.all()}")
+        return mode_info
 
     @classmethod
     def get_func(cls, mode: str) -> typing.Optional[typing.Callable]:
@@ -257,9 +301,7 @@ class ScraperModeManager:
         Raises:
             ValueError: If no function is associated with the mode.
         """
-        cls.validate(mode)
-        mode_info = cls.get_mode(mode)
-        func = mode_info.func
+        func = cls.get_mode(mode).func
         if func is None:
             raise ValueError(f"Aucune fonction associée au mode '{mode}'")
         return func
@@ -273,7 +315,7 @@ class ScraperModeManager:
             
         if mode.expected_input_type in cls._output_registry:
             source_mode = cls._output_registry[mode.expected_input_type]
-            return f"{source_mode}.json"
+            return cls._modes[source_mode].output_file
         
         return None
 
@@ -300,8 +342,8 @@ class ModeResult(BaseModel):
         status (ModeStatus): The status of the mode operation (success or error).
         message (Optional[str]): An optional message related to the mode result.
     """
-    status: ModeStatus = Field(ModeStatus.ERROR, alias="status")
-    message: typing.Optional[str] = Field(None, alias="message")
+    status: ModeStatus = ModeStatus.ERROR
+    message: typing.Optional[str] = None
 
 
 class ScrapedDocument(BaseModel):
@@ -325,10 +367,10 @@ class ScrapedDocument(BaseModel):
         to_dict(self) -> Dict[str, Any]:
             Converts the ScrapedDocument instance into a dictionary format, with the creation timestamp formatted as a string.
     """
-    source: typing.Optional[str] = Field(None, alias="source")
-    origin: typing.Dict[str, str] = Field({}, alias="origin")
+    source: typing.Optional[str] = None
+    origin: typing.Dict[str, str] = {}
     
-    document: Document = Field(Document(), alias="document")
+    document: Document = Document()
     
     unique_id: str = Field(default_factory=lambda: hashlib.md5().hexdigest())
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -341,7 +383,9 @@ class ScrapedDocument(BaseModel):
     def from_document(
         cls, document: Document, source: str, mode: str
     ) -> "ScrapedDocument":
-        return cls(
+        # Every field is built here from already-validated values, so skip
+        # pydantic validation: this runs once per scraped document.
+        return cls.model_construct(
             source=source,
             origin={"mode": mode},
             document=document,
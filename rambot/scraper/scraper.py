@@ -1,8 +1,12 @@
-import json
+import os
 import time
+import typing
 import random
 import argparse
 
+import ijson
+import orjson
+
 from botasaurus_driver.driver import Wait
 from ..browser.driver import Driver
 from .html import HTML
@@ -10,6 +14,7 @@ from .html import HTML
 from .. import helpers
 from ..logging_config import update_logger_config, get_logger
 from ..types import IScraper
+from ..http.cache import enable_cache
 
 from .utils import scrape
 from .interceptor import Interceptor
@@ -19,6 +24,55 @@ from .config import ScraperConfig
 from .exceptions import DriverError
 
 
+# Browser arguments used when `setup_driver_config` is not given any.
+_DEFAULT_CHROME_ARGS = (
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors=yes",
+    "--disable-blink-features=AutomationControlled",
+)
+
+# Script run by `eval_text`, formatted with the XPath and separator as JSON string literals.
+_EVAL_TEXT_JS = """
+const nodes = document.evaluate(%s, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const texts = [];
+for (let i = 0; i < nodes.snapshotLength; i++) {
+    const node = nodes.snapshotItem(i);
+    texts.push((node.innerText || node.textContent || "").trim());
+}
+return texts.join(%s);
+"""
+
+# Buffer size (1 MiB) of the output files written by `write` and `write_jsonl`.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Command line parser, built once at import.
+_PARSER = argparse.ArgumentParser(description="Launch script with a specific mode")
+_PARSER.add_argument("--mode", type=str, required=False)
+_PARSER.add_argument("--url", type=str, required=False)
+
+# Parsed command line, shared by every Scraper created in this process.
+_ARGS: typing.Optional[argparse.Namespace] = None
+
+
+def _parse_args() -> argparse.Namespace:
+    """
+    Parses the command line once per process and returns the cached namespace.
+
+    Unknown arguments are ignored so the scraper can run under another program's
+    command line. When `--mode` is not given, the `SCRAPER_MODE` environment
+    variable is used instead.
+    """
+    global _ARGS
+    if _ARGS is None:
+        args = _PARSER.parse_known_args()[0]
+        if args.mode is None:
+            args.mode = os.getenv("SCRAPER_MODE")
+            if args.mode is None:
+                _PARSER.error("the following arguments are required: --mode (or set SCRAPER_MODE)")
+        _ARGS = args
+    return _ARGS
+
+
 class Scraper(IScraper):
 
     mode_manager = mode_manager_instance
@@ -50,18 +104,17 @@ class Scraper(IScraper):
 
     # ---- Setup ----
     def setup(self):
-        parser = argparse.ArgumentParser(description="Launch script with a specific mode")
-        parser.add_argument("--mode", type=str, required=True)
-        parser.add_argument("--url", type=str, required=False)
-        self.args = parser.parse_args()
+        self.args = _parse_args()
         
-        self.mode_manager.validate(self.args.mode)
-        self.mode = self.args.mode
+        # get_mode raises for unknown modes, so it doubles as the validation step.
+        mode_info = self.mode_manager.get_mode(self.args.mode)
+        # The registered name is interned, so later lookups hit on identity.
+        self.mode = mode_info.name
         
         self._target_url = self.args.url
-        self.setup_logging(mode=self.mode_manager.get_mode(self.mode))
+        self.setup_logging(mode=mode_info)
 
-    def setup_exception_handler(self, must_raise_exceptions=[Exception]):
+    def setup_exception_handler(self, must_raise_exceptions=None):
         self.exception_handler = ExceptionHandler(must_raise_exceptions=must_raise_exceptions)
 
     def setup_driver_config(self, **kwargs):
@@ -71,17 +124,14 @@ class Scraper(IScraper):
             profile=kwargs.get("profile"),
             tiny_profile=kwargs.get("tiny_profile", False),
             block_images=kwargs.get("block_images", False),
-            block_images_and_css=kwargs.get("block_images_and_css", False),
+            block_images_and_css=kwargs.get("block_images_and_css", True),
             wait_for_complete_page_load=kwargs.get("wait_for_complete_page_load", False),
-            extensions=kwargs.get("extensions", []),
-            arguments=kwargs.get("arguments", [
-                "--ignore-certificate-errors",
-                "--ignore-ssl-errors=yes",
-                "--disable-blink-features=AutomationControlled"
-            ]),
+            extensions=kwargs.get("extensions"),
+            arguments=kwargs.get("arguments", _DEFAULT_CHROME_ARGS),
             user_agent=kwargs.get("user_agent"),
             lang=kwargs.get("lang"),
-            beep=kwargs.get("beep", False)
+            beep=kwargs.get("beep", False),
+            cache_responses=kwargs.get("cache_responses", False)
         )
 
     def update_driver_config(self, **kwargs):
@@ -101,10 +151,14 @@ class Scraper(IScraper):
             if not hasattr(self, "args") or not hasattr(self.args, "mode"):
                 raise RuntimeError("Calling .run() without calling .setup() first")
             
+            if self.config.cache_responses:
+                enable_cache()
+
             self._interceptor.start()
 
-            method = self.mode_manager.get_func(self.mode)
-            decorated_method = scrape(method)
+            wrapped = self.mode_manager.get_mode(self.mode).wrapped
+            # Modes registered without `bind` are wrapped on the fly.
+            decorated_method = wrapped or scrape(self.mode_manager.get_func(self.mode))
             result = decorated_method(self)
 
             self._interceptor.stop()
@@ -134,31 +188,17 @@ class Scraper(IScraper):
     # ---- Browser ----
     @property
     def driver(self):
-        if not self._driver:
+        if self._driver is None:
             self.open_browser()
         return self._driver
 
     @helpers.no_print
     def open_browser(self, wait=True):
         try:
-            self.logger.debug(f"Opening browser (Headless: {self.config.headless}) ...")
-
-            is_headless = bool(self.config.headless)
+            driver_kwargs = self.config.to_driver_kwargs()
+            self.logger.debug("Opening browser (Headless: {}) ...", driver_kwargs.get("headless", False))
             
-            self._driver = Driver(
-                headless=is_headless,
-                proxy=self.config.proxy,
-                profile=self.config.profile,
-                tiny_profile=self.config.tiny_profile,
-                block_images=self.config.block_images,
-                block_images_and_css=self.config.block_images_and_css,
-                wait_for_complete_page_load=wait,
-                extensions=self.config.extensions,
-                arguments=self.config.arguments or [],
-                user_agent=self.config.user_agent,
-                lang=self.config.lang,
-                beep=self.config.beep,
-            )
+            self._driver = Driver(wait_for_complete_page_load=wait, **driver_kwargs)
 
             if not self._driver._tab:
                 raise DriverError("Can't initialize driver tab")
@@ -170,7 +210,7 @@ class Scraper(IScraper):
     def close_browser(self):
         try:
             self.logger.debug("Closing browser...")
-            if self._driver:
+            if self._driver is not None:
                 self._driver.close()
                 self._driver = None
         except Exception as e:
@@ -224,6 +264,24 @@ class Scraper(IScraper):
             self._html = HTML(driver=self.driver)
         return self._html
 
+    def eval_text(self, xpath, separator=", "):
+        """
+        Returns the stripped text of every element matching an XPath, joined together.
+
+        The texts are collected by a single script run in the page, instead of one CDP
+        round-trip per element as with `[el.text.strip() for el in self.html.find_all(xpath)]`.
+        Unlike `html.find_all`, it does not wait for the elements to appear.
+
+        Args:
+            xpath (str): The XPath query, evaluated against the whole document.
+            separator (str): String placed between the texts. Defaults to ", ".
+
+        Returns:
+            str: The joined texts, or an empty string if nothing matches.
+        """
+        script = _EVAL_TEXT_JS % (orjson.dumps(xpath).decode(), orjson.dumps(separator).decode())
+        return self.execute_script(script)
+
     
     # ---- Storage ----
     def get_cookies(self): return self.driver.get_cookies()
@@ -251,33 +309,119 @@ class Scraper(IScraper):
     def sleep(self, t = None):
         if t is None:
             return
-        self.logger.debug(f"Waiting {t}s ...")
+        self.logger.debug("Waiting {}s ...", t)
         time.sleep(t)
 
     def wait(self, min=0.1, max=1):
         delay = random.uniform(min, max)
-        self.logger.debug(f"Waiting {delay}s ...")
+        self.logger.debug("Waiting {}s ...", delay)
 
         time.sleep(delay)
 
     def save(self, data: list[ScrapedDocument]):
         try:
             self.write(data=data)
-            self.logger.debug(f"Saved {len(data)} document(s)")
+            self.logger.debug("Saved {} document(s)", len(data))
         except Exception as e:
             self.exception_handler.handle(e)
 
     def write(self, data):
         try:
-            with open(f"{self.mode}.json", 'w') as file:
-                json.dump([d.to_dict() for d in data], file, indent=4)
+            mode_info = self.mode_manager.get_mode(self.mode)
+            if mode_info.output_format == "jsonl":
+                self.write_jsonl(data=data, filename=mode_info.output_file)
+                return
+
+            # Documents are encoded and written one at a time through a large buffer,
+            # so the whole list is never held as dicts or as one bytes object. The
+            # output is byte-identical to orjson.dumps(list, option=OPT_INDENT_2).
+            with open(mode_info.output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as file:
+                if not data:
+                    file.write(b"[]")
+                    return
+
+                separator = b"[\n  "
+                for d in data:
+                    file.write(separator)
+                    file.write(orjson.dumps(d.to_dict(), option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+                    separator = b",\n  "
+                file.write(b"\n]")
         except Exception as e:
             self.exception_handler.handle(e)
 
+    def write_jsonl(self, data, filename, append=True):
+        """
+        Writes documents to a JSON Lines file, one document per line.
+
+        When appending, the existing content is kept, so each call only costs the size
+        of `data`. The scrape wrapper truncates the file once at mode start and then
+        appends each newly collected document.
+
+        Args:
+            data (list[ScrapedDocument]): The documents to write.
+            filename (str): Path of the JSONL file.
+            append (bool): If False, the file is truncated first. Defaults to True.
+        """
+        with open(filename, 'ab' if append else 'wb', buffering=_WRITE_BUFFER_SIZE) as file:
+            for d in data:
+                file.write(orjson.dumps(d.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
+
     def read(self, filename):
         try:
-            with open(filename, 'r') as file:
-                return json.load(file)
+            if filename.endswith(".jsonl"):
+                return list(self.read_jsonl(filename))
+
+            with open(filename, 'rb') as file:
+                return orjson.loads(file.read())
+        except Exception as e:
+            self.exception_handler.handle(e)
+
+    def read_jsonl(self, filename):
+        """
+        Reads a JSON Lines file one entry at a time. Blank lines are skipped.
+
+        Entries whose document link was already seen are skipped as well, so a
+        dependent mode never processes the same document twice.
+
+        Args:
+            filename (str): Path of the JSONL file.
+
+        Yields:
+            dict: Each entry with a new link (or no link), in file order.
+        """
+        seen = set()
+        with open(filename, 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                link = entry.get("document", {}).get("link")
+                if link:
+                    if link in seen:
+                        continue
+                    seen.add(link)
+                yield entry
+
+    def iter_read(self, filename):
+        """
+        Streams the entries of a JSON list file one at a time.
+
+        JSON Lines files are read line by line. Unlike `read`, the file is never loaded whole, so memory stays flat
+        regardless of its size.
+
+        Args:
+            filename (str): Path of the JSON file written by a previous mode.
+
+        Yields:
+            dict: Each entry of the list, in file order.
+        """
+        try:
+            if filename.endswith(".jsonl"):
+                yield from self.read_jsonl(filename)
+                return
+
+            with open(filename, 'rb') as file:
+                yield from ijson.items(file, "item", use_float=True)
         except Exception as e:
             self.exception_handler.handle(e)
 
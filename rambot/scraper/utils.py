@@ -1,15 +1,22 @@
+from time import monotonic
 from functools import wraps
+from itertools import islice
 from inspect import signature, isclass
 from typing import (
-    Callable, List,
-    Optional, Union, Type,
-    Any, Set,
+    Callable, List, Iterable,
+    Optional, Union, Type, Literal,
+    Any, Dict,
     get_type_hints, get_origin, get_args
 )
 
 from .models import Document, ScrapedDocument, Mode, mode_manager
 from ..types import IScraper
 
+
+# Calls faster than this (in seconds) are assumed not to have hit the network
+# (cache hit, early return or early failure), so the polite delay is skipped.
+_MIN_NETWORK_CALL_DURATION = 0.2
+
 def _extract_doc_type(func: Callable) -> Type[Document]:
     """Helper to find the Document subclass in '-> list[City]'"""
     try:
@@ -37,7 +44,10 @@ def bind(
     save: Optional[Callable[[Any], None]] = None,
     enable_file_logging: bool = False,
     log_file_name: Optional[str] = None,
-    log_directory: str = "."
+    log_directory: str = ".",
+    stream_input: bool = False,
+    batch_size: Optional[int] = None,
+    output_format: Literal["json", "jsonl"] = "json"
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Registers a function as a scraper mode and configures its automated data pipeline.
@@ -62,6 +72,17 @@ def bind(
         log_file_name (Optional[str]): Custom log filename. If None, defaults to 
             '{mode}_{date}.log'.
         log_directory (str): Directory for log storage. Defaults to current directory.
+        stream_input (bool): If True, the input file is parsed incrementally and documents
+            are processed as they are read, keeping memory flat on very large inputs.
+            Defaults to False.
+        batch_size (Optional[int]): If set, the function receives a `List[Document]` of up
+            to `batch_size` documents per call instead of a single document, and the
+            delay between calls applies once per batch. Defaults to None.
+        output_format (Literal["json", "jsonl"]): Format of the output file. "json" rewrites
+            '{mode}.json' with the whole result list at the end of the run; "jsonl" empties
+            '{mode}.jsonl' at mode start, then appends each new document as soon as it is
+            collected, so a crash keeps everything scraped so far.
+            Dependent modes read whichever file the mode produces. Defaults to "json".
 
     Returns:
         Callable: The original function, registered within the ScraperModeManager.
@@ -87,6 +108,14 @@ def bind(
         def get_details(self, doc: Document):
             self.load_page(doc.link)
         ```
+
+        **Option 3: Batched Input**
+        ```python
+        @bind("details", input="listing.json", batch_size=50)
+        def get_details(self, docs: List[Document]):
+            for doc in docs:
+                ...
+        ```
     """
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         final_output_type = document_output or _extract_doc_type(func)
@@ -97,17 +126,26 @@ def bind(
             if name != 'self' and param.annotation is not param.empty:
                 input_type = param.annotation
                 break
+
+        # Batched modes take 'List[City]': the documents themselves are 'City'.
+        if batch_size and get_origin(input_type) is list:
+            input_type = next(iter(get_args(input_type)), None)
             
         mode_manager.register(
             name=mode,
             func=func,
+            # Wrapped once here instead of on every run.
+            wrapped=scrape(func),
             input=input,
             document_output=final_output_type,
             expected_input_type=input_type,
             save=save,
             enable_file_logging=enable_file_logging,
             log_file_name=log_file_name,
-            log_directory=log_directory
+            log_directory=log_directory,
+            stream_input=stream_input,
+            batch_size=batch_size,
+            output_format=output_format
         )
         return func
 
@@ -152,7 +190,7 @@ def scrape(func: Callable[..., List[Document]]) -> Callable[..., List[Document]]
     @wraps(func)
     def wrapper(self: Type[IScraper], *args, **kwargs) -> List[Document]:
 
-        def prepare_input(mode_info: Mode) -> List[Any]:
+        def prepare_input(mode_info: Mode) -> Iterable[Any]:
             if (url := getattr(self.args, "url", None)):
                 dummy_doc = mode_info.expected_input_type(link=url)
                 
@@ -166,31 +204,54 @@ def scrape(func: Callable[..., List[Document]]) -> Callable[..., List[Document]]
             if callable(input_source):
                 return input_source(self)
 
+            if mode_info.stream_input:
+                return self.iter_read(filename=input_source)
+
             return self.read(filename=input_source)
 
-        def validate_results(items: Any) -> Set[Document]:
-            """Ensure returned items are a set of Documents."""
+        # Keyed by document (hashed on `link`) to drop duplicates while keeping the
+        # order in which they were scraped; values are unused.
+        results: Dict[Document, None] = {}
+        # JSON Lines modes write each new document as soon as it is collected, so a
+        # crash keeps everything scraped so far.
+        checkpoint = False
+
+        def to_scraped(documents: Iterable[Document]) -> List[ScrapedDocument]:
+            return [
+                ScrapedDocument.from_document(
+                    document=r, 
+                    mode=self.mode, 
+                    source=self.__class__.__name__
+                ) 
+                for r in documents
+            ]
+
+        def collect_results(items: Any) -> None:
+            """Ensure returned items are Documents and add them to the results."""
             if not items:
-                return set()
+                return
             if not isinstance(items, (list, set)):
-                items = {items}
-            else:
-                items = set(items)
+                items = (items,)
             if not all(isinstance(r, Document) for r in items):
                 raise TypeError(f"Expected List[Document], but got {type(items)} with elements {items}")
-            return items
-
-        results: Set[Document] = set()
+            new_items = [r for r in dict.fromkeys(items) if r not in results]
+            results.update(dict.fromkeys(new_items))
+            if checkpoint and new_items:
+                self.save(data=to_scraped(new_items))
 
         try:
-            self.mode_manager.validate(self.mode)
             mode_info = self.mode_manager.get_mode(self.mode)
             
             if mode_info.func is None:
                 raise ValueError(f"No function associated with mode '{self.mode}'")
 
+            if mode_info.output_format == "jsonl":
+                # Start from an empty file so a rerun does not append the same documents again.
+                self.write_jsonl(data=[], filename=mode_info.output_file, append=False)
+                checkpoint = True
+
             method = mode_info.func.__get__(self, type(self))
-            self.logger.debug(f"Running scraper mode \"{self.mode}\"")
+            self.logger.debug("Running scraper mode \"{}\"", self.mode)
 
             self.open_browser()
 
@@ -198,27 +259,53 @@ def scrape(func: Callable[..., List[Document]]) -> Callable[..., List[Document]]
 
             # Check if the mode expects a positional argument (like 'city: City')
             if input_list:
-                for data in input_list:
-                    # Use the expected type hint (City) discovered by @bind
-                    input_cls = mode_info.expected_input_type or Document
-                    doc = self.create_document(obj=data, document=input_cls)
-                    
-                    self.logger.debug(f"Processing {doc}")
-
-                    try:
-                        # This passes 'doc' as the required positional argument
-                        result = method(doc, *args, **kwargs)
-                        results.update(validate_results(result))
-                    except Exception as e:
-                        self.logger.error(f"Error processing {doc}: {e}")
-
-                    self.wait(1, 2)
+                # Use the expected type hint (City) discovered by @bind
+                input_cls = mode_info.expected_input_type or Document
+                create_document = self.create_document
+                log_debug = self.logger.debug
+                log_error = self.logger.error
+                wait = self.wait
+
+                batch_size = mode_info.batch_size
+
+                if batch_size:
+                    data_iter = iter(input_list)
+                    while (chunk := list(islice(data_iter, batch_size))):
+                        docs = [create_document(obj=data, document=input_cls) for data in chunk]
+
+                        log_debug("Processing batch of {} documents", len(docs))
+
+                        started = monotonic()
+                        try:
+                            result = method(docs, *args, **kwargs)
+                            collect_results(result)
+                        except Exception as e:
+                            log_error("Error processing batch of {} documents: {}", len(docs), e)
+
+                        if monotonic() - started >= _MIN_NETWORK_CALL_DURATION:
+                            wait(1, 2)
+                else:
+                    for data in input_list:
+                        doc = create_document(obj=data, document=input_cls)
+
+                        log_debug("Processing {}", doc)
+
+                        started = monotonic()
+                        try:
+                            # This passes 'doc' as the required positional argument
+                            result = method(doc, *args, **kwargs)
+                            collect_results(result)
+                        except Exception as e:
+                            log_error("Error processing {}: {}", doc, e)
+
+                        if monotonic() - started >= _MIN_NETWORK_CALL_DURATION:
+                            wait(1, 2)
             else:
                 result = method(*args, **kwargs)
-                results.update(validate_results(result))
+                collect_results(result)
 
         except Exception as e:
-            results = set()
+            results = {}
             self.exception_handler.handle(e)
         finally:
             # Ensure mode_info exists before accessing save or save logic
@@ -226,16 +313,9 @@ def scrape(func: Callable[..., List[Document]]) -> Callable[..., List[Document]]
                 if mode_info.save is not None:
                     mode_info.save(self, list(results))
 
-                self.save(
-                    data=[
-                        ScrapedDocument.from_document(
-                            document=r, 
-                            mode=self.mode, 
-                            source=self.__class__.__name__
-                        ) 
-                        for r in results
-                    ]
-                )
+                # Checkpointed modes already wrote every document as it was collected.
+                if not checkpoint:
+                    self.save(data=to_scraped(results))
             
             self.close_browser()
             return list(results)
@@ -1,14 +1,46 @@
 import os
-import json
 import tempfile
 
+import msgpack
+
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Dict, Any, Iterable
 
 from .scraper import IScraper
 from .request import Response, Request
 
 
+def _decode_records(buffer: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode a run of length-prefixed MessagePack records.
+
+    Each record is prefixed by its length as a 4-byte little-endian integer.
+    Records that fail to decode are skipped and a truncated trailing record
+    (still being written by mitmproxy) ends the run.
+
+    Args:
+        buffer (bytes): Raw bytes made of consecutive records.
+
+    Returns:
+        List[Dict[str, Any]]: The decoded records.
+    """
+    view = memoryview(buffer)
+    records = []
+    offset = 0
+    end = len(view)
+    while offset + 4 <= end:
+        length = int.from_bytes(view[offset:offset + 4], "little")
+        offset += 4
+        if offset + length > end:
+            break
+        try:
+            records.append(msgpack.unpackb(view[offset:offset + length], raw=False))
+        except ValueError:
+            pass
+        offset += length
+    return records
+
+
 class IInterceptor(ABC):
     """
     Abstract Base Class for a request interceptor used in web scraping.
@@ -34,7 +66,7 @@ class IInterceptor(ABC):
 
         self._requests_path = os.path.join(
             tempfile.gettempdir(),
-            f"__{self._scraper.__class__.__name__.lower()}_requests.json"
+            f"__{self._scraper.__class__.__name__.lower()}_requests.msgpack"
         )
 
     @abstractmethod
@@ -59,13 +91,16 @@ class IInterceptor(ABC):
     @abstractmethod
     def requests(
         self,
-        predicate: Optional[Callable[[Request], bool]] = None
+        predicate: Optional[Callable[[Request], bool]] = None,
+        status_codes: Optional[Iterable[int]] = None
     ) -> List[Request]:
         """
         Retrieve captured requests.
 
         Args:
             predicate (Optional[Callable[[Request], bool]]): Filter function.
+            status_codes (Optional[Iterable[int]]): Only keep requests whose 
+                response status is one of these codes.
 
         Returns:
             List[Request]: List of captured network objects.
@@ -76,42 +111,36 @@ class IInterceptor(ABC):
         """
         Internal helper to parse captured traffic from the local storage file.
 
-        Reads the JSONL file line-by-line and reconstructs Request and Response 
-        objects. This is designed to be memory efficient for large logs.
-
         Returns:
             List[Request]: Reconstructed request objects with nested responses.
         """
         if not os.path.exists(self._requests_path):
             return []
 
+        with open(self._requests_path, "rb") as f:
+            buffer = f.read()
+
+        records = _decode_records(buffer)
+
         requests_list = []
-        with open(self._requests_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-
-                    req_data = data["request"]
-                    res_data = data["response"]
-
-                    response_obj = Response(
-                        url=res_data.get("url", req_data.get("url", "")),
-                        status=res_data.get("status", 0),
-                        headers=res_data.get("headers", {}),
-                        body=res_data.get("body", "")
-                    )
-
-                    request_obj = Request(
-                        method=req_data.get("method", ""),
-                        url=req_data.get("url", ""),
-                        headers=req_data.get("headers", {}),
-                        body=req_data.get("body", ""),
-                        response=response_obj
-                    )
-
-                    requests_list.append(request_obj)
-                except json.JSONDecodeError:
-                    pass
+        for data in records:
+            req_data = data["request"]
+            res_data = data["response"]
+
+            response_obj = Response(
+                url=res_data.get("url", req_data.get("url", "")),
+                status=res_data.get("status", 0),
+                headers=res_data.get("headers", {}),
+                body=res_data.get("body", "")
+            )
+
+            request_obj = Request(
+                method=req_data.get("method", ""),
+                url=req_data.get("url", ""),
+                headers=req_data.get("headers", {}),
+                body=req_data.get("body", ""),
+                response=response_obj
+            )
+
+            requests_list.append(request_obj)
         return requests_list
@@ -1,6 +1,8 @@
 import re
-import json
 
+import orjson
+
+from dataclasses import dataclass
 from typing import Any, Literal, Optional, Dict as TypingDict, Union, List
 from urllib.parse import urlparse
 
@@ -11,29 +13,30 @@ ResourceType = Literal[
 
 HTTPMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
 
-class DotDict(TypingDict[str, Any]):
-    """Base class allowing dot notation access while remaining a native dict."""
-    def __getattr__(self, name: str) -> Any:
-        try:
-            return self[name]
-        except KeyError:
-            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+@dataclass
+class Response:
+    """Captured HTTP response. Slot-backed for fast attribute access."""
+    __slots__ = ("url", "status", "headers", "body")
 
-class Response(DotDict):
     url: str
     status: int
     headers: TypingDict[str, str]
     body: str
 
-    def __init__(self, url: str, status: int, headers: TypingDict[str, str], body: str):
-        super().__init__(url=url, status=status, headers=headers, body=body)
-
     def json(self) -> Optional[Union[TypingDict[str, Any], List[Any]]]:
         try:
-            return json.loads(self.body)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(self.body)
+        except (orjson.JSONDecodeError, TypeError):
             return None
 
+    def to_dict(self) -> TypingDict[str, Any]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "body": self.body
+        }
+
     @property
     def ok(self) -> bool:
         return 200 <= self.status < 400
@@ -42,15 +45,25 @@ class Response(DotDict):
     def content_type(self) -> str:
         return self.headers.get("Content-Type", "").lower()
 
-class Request(DotDict):
+@dataclass
+class Request:
+    """Captured HTTP request and its response. Slot-backed for fast attribute access."""
+    __slots__ = ("method", "url", "headers", "body", "response")
+
     method: HTTPMethod
     url: str
     headers: TypingDict[str, str]
     body: Any
     response: Response
 
-    def __init__(self, method: HTTPMethod, url: str, headers: TypingDict[str, str], body: str, response: Response):
-        super().__init__(method=method, url=url, headers=headers, body=body, response=response)
+    def to_dict(self) -> TypingDict[str, Any]:
+        return {
+            "method": self.method,
+            "url": self.url,
+            "headers": self.headers,
+            "body": self.body,
+            "response": self.response.to_dict()
+        }
 
     @property
     def extension(self) -> str:
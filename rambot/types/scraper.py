@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import Optional, List, Dict, Type, Union, Any
+from typing import Optional, List, Dict, Type, Union, Any, Iterator
 
 from botasaurus_driver.driver import Wait
 
@@ -47,8 +47,8 @@ class IScraper(ABC):
         pass
 
     @abstractmethod
-    def setup_exception_handler(self, must_raise_exceptions: List[Type[Exception]] = [Exception]) -> None:
-        """Configure exception handler with a list of exceptions to raise immediately."""
+    def setup_exception_handler(self, must_raise_exceptions: Optional[List[Type[Exception]]] = None) -> None:
+        """Configure exception handler with a list of exceptions to raise immediately (defaults to `[Exception]`)."""
         pass
 
     @abstractmethod
@@ -132,6 +132,11 @@ class IScraper(ABC):
         """Return the HTML interface for element interaction."""
         pass
 
+    @abstractmethod
+    def eval_text(self, xpath: str, separator: str = ", ") -> str:
+        """Return the joined text of every element matching an XPath, in one browser call."""
+        pass
+
     # ---- Storage ----
     @abstractmethod
     def get_cookies(self) -> List[dict]:
@@ -201,11 +206,26 @@ class IScraper(ABC):
         """Write scraped data to disk."""
         pass
 
+    @abstractmethod
+    def write_jsonl(self, data: List[ScrapedDocument], filename: str, append: bool = True) -> None:
+        """Append (or, with append=False, write) scraped data to a JSON Lines file."""
+        pass
+
     @abstractmethod
     def read(self, filename: str) -> Dict[str, List[Document]]:
         """Read saved scraped data from disk."""
         pass
 
+    @abstractmethod
+    def iter_read(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Stream saved scraped data from disk, one entry at a time."""
+        pass
+
+    @abstractmethod
+    def read_jsonl(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Read a JSON Lines file one entry at a time, skipping repeated links."""
+        pass
+
     @abstractmethod
     def create_document(self, obj: Dict[str, Any], document: Type[Document]) -> Document:
         """Create a Document instance from a dictionary."""
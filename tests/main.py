@@ -53,11 +53,7 @@ class BasicScraper(Scraper):
         )
         
     def get_address(self) -> str:
-        els = self.html.find_all('//div[@data-testid="partner-metadata-wrapper"]/div/span')
-        
-        address = ", ".join([el.text.strip() for el in els])
-        
-        return address
+        return self.eval_text('//div[@data-testid="partner-metadata-wrapper"]/div/span')
     
     def get_reviews(self) -> float:
         el = self.html.find("//span[@aria-label='Skip Score']")